@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+import pytest
 from tollbooth.infographic import (
     AUTHORITY_METRICS,
     AUTHORITY_SECTIONS,
@@ -11,11 +12,13 @@ from tollbooth.infographic import (
     render_account_infographic,
 )
 
+_THEME = THEME_AUTHORITY.with_name("Tollbooth Authority")
+
 
 def render_operator_infographic(data):
     return render_account_infographic(
         data,
-        theme=THEME_AUTHORITY.with_name("Tollbooth Authority"),
+        theme=_THEME,
         sections=AUTHORITY_SECTIONS,
         metrics=AUTHORITY_METRICS,
     )
@@ -57,55 +60,48 @@ def _height(svg: str) -> int:
     return int(m.group(1))
 
 
+@pytest.fixture(scope="module")
+def default_svg() -> str:
+    """Default sample statement, rendered once — the SVG string is immutable."""
+    return render_operator_infographic(_sample_data())
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 
 class TestRenderOperatorInfographic:
-    def test_returns_valid_svg(self) -> None:
+    def test_returns_valid_svg(self, default_svg: str) -> None:
         """Output is a well-formed SVG string."""
-        svg = render_operator_infographic(_sample_data())
-        assert svg.startswith("<svg")
-        assert svg.endswith("</svg>")
-        assert 'xmlns="http://www.w3.org/2000/svg"' in svg
-
-    def test_header_branding(self) -> None:
-        """Header shows Authority branding."""
-        svg = render_operator_infographic(_sample_data())
-        assert "Tollbooth Authority" in svg
-        assert "Operator Account" in svg
-
-    def test_balance_displayed(self) -> None:
-        """Hero balance appears in the output."""
-        svg = render_operator_infographic(_sample_data())
-        assert "5,000" in svg
-
-    def test_metrics_displayed(self) -> None:
-        """Metric cards show deposited, fees paid, certified."""
-        svg = render_operator_infographic(_sample_data())
-        assert "10,000" in svg     # deposited
-        assert "DEPOSITED" in svg
-        assert "FEES PAID" in svg
-        assert "CERTIFIED" in svg
-
-    def test_fee_schedule_displayed(self) -> None:
-        """Fee schedule card shows the fee schedule string."""
-        svg = render_operator_infographic(_sample_data())
-        assert "FEE SCHEDULE" in svg
-        assert "Set via pricing model" in svg
-
-    def test_tranche_rendered(self) -> None:
-        """Active tranche row appears."""
-        svg = render_operator_infographic(_sample_data())
-        assert "Seed (v1)" in svg
-        assert "2026-02-28" in svg
-
-    def test_footer_branding(self) -> None:
-        """Footer includes DPYC branding."""
-        svg = render_operator_infographic(_sample_data())
-        assert "DPYC" in svg
-        assert "Tollbooth Protocol" in svg
+        assert default_svg.startswith("<svg")
+        assert default_svg.endswith("</svg>")
+        assert 'xmlns="http://www.w3.org/2000/svg"' in default_svg
+
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            # Header shows Authority branding
+            ("Tollbooth Authority", "Operator Account"),
+            # Hero balance
+            ("5,000",),
+            # Metric cards: deposited, fees paid, certified
+            ("10,000", "DEPOSITED", "FEES PAID", "CERTIFIED"),
+            # Fee schedule card
+            ("FEE SCHEDULE", "Set via pricing model"),
+            # Active tranche row
+            ("Seed (v1)", "2026-02-28"),
+            # Footer DPYC branding
+            ("DPYC", "Tollbooth Protocol"),
+            # Timestamp from generated_at in header
+            ("2026-03-01 12:00:00 UTC",),
+        ],
+        ids=["header", "balance", "metrics", "fee-schedule", "tranche", "footer", "timestamp"],
+    )
+    def test_default_statement_content(self, default_svg: str, expected: tuple[str, ...]) -> None:
+        """Each section of the default statement shows its expected text."""
+        for text in expected:
+            assert text in default_svg
 
     def test_zero_balance(self) -> None:
         """Renders without error when balance is zero."""
@@ -151,9 +147,8 @@ class TestRenderOperatorInfographic:
         assert "&lt;" in svg
         assert "&gt;" in svg
 
-    def test_dynamic_height(self) -> None:
+    def test_dynamic_height(self, default_svg: str) -> None:
         """SVG height adjusts with more tranche rows."""
-        svg_short = render_operator_infographic(_sample_data())
         many_tranches = [
             {
                 "granted_at": f"2026-02-{20+i}T10:00:00+00:00",
@@ -166,7 +161,7 @@ class TestRenderOperatorInfographic:
         svg_tall = render_operator_infographic(
             _sample_data(active_tranches=many_tranches)
         )
-        assert _height(svg_tall) > _height(svg_short)
+        assert _height(svg_tall) > _height(default_svg)
 
     def test_custom_fee_schedule(self) -> None:
         """Custom fee schedule string is displayed."""
@@ -174,8 +169,3 @@ class TestRenderOperatorInfographic:
             _sample_data(fee_schedule="Custom pricing: 5% rate, 25 sat floor")
         )
         assert "Custom pricing: 5% rate, 25 sat floor" in svg
-
-    def test_timestamp_in_header(self) -> None:
-        """Timestamp from generated_at appears in header."""
-        svg = render_operator_infographic(_sample_data())
-        assert "2026-03-01 12:00:00 UTC" in svg
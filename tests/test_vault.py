@@ -24,6 +24,13 @@ def _mock_response(status: int = 200, json_data: dict | None = None, text: str =
     return resp
 
 
+def _returning(value=None):
+    """Plain coroutine stub for collaborators whose calls are never asserted."""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
+
+
 @pytest.fixture
 def vault():
     v = TheBrainVault(
@@ -43,12 +50,12 @@ def vault():
 @pytest.mark.asyncio
 async def test_store_ledger_creates_parent_and_child(vault: TheBrainVault):
     """New user: creates ledger parent, registers as hasMember, writes daily child."""
-    vault._discover_members = AsyncMock(return_value={})
-    vault._create_thought = AsyncMock(return_value={"id": "parent-1"})
-    vault._set_note = AsyncMock()
-    vault._get_graph = AsyncMock(return_value={"children": [], "links": []})
+    vault._discover_members = _returning({})
+    vault._create_thought = _returning({"id": "parent-1"})
+    vault._set_note = _returning()
+    vault._get_graph = _returning({"children": [], "links": []})
     vault._register_member = AsyncMock()
-    vault._get_children = AsyncMock(return_value=[])
+    vault._get_children = _returning([])
 
     # Second call to _create_thought for the daily child
     vault._create_thought = AsyncMock(side_effect=[
@@ -64,10 +71,10 @@ async def test_store_ledger_creates_parent_and_child(vault: TheBrainVault):
 @pytest.mark.asyncio
 async def test_store_ledger_existing_user_reuses_parent(vault: TheBrainVault):
     """Existing user: finds member via _discover_members, writes to daily child."""
-    vault._discover_members = AsyncMock(return_value={"op-1/ledger": "parent-1"})
-    vault._get_children = AsyncMock(return_value=[])
-    vault._create_thought = AsyncMock(return_value={"id": "child-1"})
-    vault._set_note = AsyncMock()
+    vault._discover_members = _returning({"op-1/ledger": "parent-1"})
+    vault._get_children = _returning([])
+    vault._create_thought = _returning({"id": "child-1"})
+    vault._set_note = _returning()
 
     result = await vault.store_ledger("op-1", '{"balance": 500}')
     assert result == "child-1"
@@ -80,7 +87,7 @@ async def test_store_ledger_existing_user_reuses_parent(vault: TheBrainVault):
 
 @pytest.mark.asyncio
 async def test_fetch_ledger_returns_none_for_unknown_user(vault: TheBrainVault):
-    vault._discover_members = AsyncMock(return_value={})
+    vault._discover_members = _returning({})
 
     result = await vault.fetch_ledger("unknown-user")
     assert result is None
@@ -89,8 +96,8 @@ async def test_fetch_ledger_returns_none_for_unknown_user(vault: TheBrainVault):
 @pytest.mark.asyncio
 async def test_fetch_ledger_reads_most_recent_child(vault: TheBrainVault):
     """Finds ledger parent via _discover_members, reads most recent daily child."""
-    vault._discover_members = AsyncMock(return_value={"op-1/ledger": "parent-1"})
-    vault._get_children = AsyncMock(return_value=[
+    vault._discover_members = _returning({"op-1/ledger": "parent-1"})
+    vault._get_children = _returning([
         {"id": "day-1", "name": "2026-02-17"},
         {"id": "day-2", "name": "2026-02-18"},
     ])
@@ -109,9 +116,9 @@ async def test_fetch_ledger_reads_most_recent_child(vault: TheBrainVault):
 
 @pytest.mark.asyncio
 async def test_snapshot_ledger_creates_timestamped_child(vault: TheBrainVault):
-    vault._discover_members = AsyncMock(return_value={"op-1/ledger": "parent-1"})
-    vault._create_thought = AsyncMock(return_value={"id": "snap-1"})
-    vault._set_note = AsyncMock()
+    vault._discover_members = _returning({"op-1/ledger": "parent-1"})
+    vault._create_thought = _returning({"id": "snap-1"})
+    vault._set_note = _returning()
 
     result = await vault.snapshot_ledger("op-1", '{"balance": 100}', "2026-02-18T12:00:00Z")
     assert result == "snap-1"
@@ -119,7 +126,7 @@ async def test_snapshot_ledger_creates_timestamped_child(vault: TheBrainVault):
 
 @pytest.mark.asyncio
 async def test_snapshot_returns_none_without_ledger(vault: TheBrainVault):
-    vault._discover_members = AsyncMock(return_value={})
+    vault._discover_members = _returning({})
 
     result = await vault.snapshot_ledger("op-1", '{}', "2026-02-18T12:00:00Z")
     assert result is None